@@ -1,23 +1,47 @@
-from PyQt6.QtWidgets import QWidget, QVBoxLayout, QFileDialog, QTabWidget
+from PyQt6.QtWidgets import QWidget, QFileDialog, QTabWidget
 import os
 
 
 class FolderTab(QTabWidget):
+    # Static tab shape, built once instead of re-allocated per instance
+    _TAB_LABELS = (
+        ("Folder 1", "[1] Select Folder"),
+        ("Folder 2", "[2] Select Folder"),
+        ("Folder 3", "[3] Select Folder"),
+    )
+
     def __init__(self):
         super().__init__()
         self.setTabPosition(QTabWidget.TabPosition.South)
         self.setMovable(True)
 
-        # Initialize tabs with empty folders
-        self.addTab(FolderWidget("Folder 1"), "[1] Select Folder")
-        self.addTab(FolderWidget("Folder 2"), "[2] Select Folder")
-        self.addTab(FolderWidget("Folder 2"), "[3] Select Folder")
+        # Initialize tabs with empty folders; updates are suspended so Qt
+        # runs one layout pass after the last insert rather than one per tab
+        self.setUpdatesEnabled(False)
+        try:
+            for name, label in self._TAB_LABELS:
+                self.addTab(FolderWidget(name), label)
+        finally:
+            self.setUpdatesEnabled(True)
 
-        # Connect tab clicked event
+        # Connect tab clicked event; double-click reconfigures a set folder
         self.tabBarClicked.connect(self.handle_tab_click)
+        self.tabBarDoubleClicked.connect(self.choose_folder)
 
     def handle_tab_click(self, index):
-        """Handle tab click by opening folder dialog"""
+        """Handle tab click by opening the folder dialog if none is set yet.
+
+        Clicking an already-configured tab is a plain tab switch; the native
+        directory dialog (slow on networked drives) only appears when the
+        tab still needs a folder. Double-click to change an existing one.
+        """
+        current_widget = self.widget(index)
+        if current_widget and current_widget.get_folder_path():
+            return
+        self.choose_folder(index)
+
+    def choose_folder(self, index):
+        """Ask the user for a folder and bind it to the tab."""
         current_widget = self.widget(index)
         folder_path = QFileDialog.getExistingDirectory(
             self, f"Select folder for Tab {index + 1}"
@@ -34,10 +58,6 @@ class FolderWidget(QWidget):
         self.folder_path = ""
         self.folder_name = name
 
-        # Create layout
-        layout = QVBoxLayout()
-        self.setLayout(layout)
-
     def set_folder_path(self, path):
         """Set the folder path for this widget"""
         self.folder_path = path
@@ -1,37 +1,284 @@
 import os
 from PyQt6.QtWidgets import QListWidgetItem
-from PyQt6.QtGui import QIcon, QPixmap
-from .thumbnail_creator import create_thumbnail
-from PyQt6.QtCore import Qt
+from PyQt6.QtGui import QIcon, QImage, QImageReader, QPixmap, QPixmapCache
+from PyQt6.QtCore import Qt, QObject, QRunnable, QThreadPool, pyqtSignal
+from .thumbnail_creator import create_thumbnail_image
+
+# Hoisted so the suffix matcher is built once, not per folder scan
+_IMAGE_EXTS = frozenset({".png", ".jpg", ".jpeg", ".bmp", ".gif"})
+
+
+def _is_image_name(name):
+    """Check a filename's suffix against the image extension set.
+
+    Lower-cases only the extension, so the per-entry filter cost is bounded
+    by the suffix length rather than the whole filename.
+    """
+    dot = name.rfind(".")
+    return dot >= 0 and name[dot:].lower() in _IMAGE_EXTS
+
+
+# Reused decode target for load_image (GUI thread only): QImageReader fills
+# this buffer in place, so sequential navigation reuses one allocation
+# instead of leaving a fresh full-size QImage behind on every key press.
+_decode_buffer = QImage()
+
+
+# Flyweight icon shared by every list item until its real thumbnail lands;
+# lazily built because QPixmap needs a QApplication.
+_PLACEHOLDER_ICON = None
+
+
+def _placeholder_icon():
+    global _PLACEHOLDER_ICON
+    if _PLACEHOLDER_ICON is None:
+        pixmap = QPixmap(64, 64)
+        pixmap.fill(Qt.GlobalColor.transparent)
+        _PLACEHOLDER_ICON = QIcon(pixmap)
+    return _PLACEHOLDER_ICON
+
+
+class _PrefetchBridge(QObject):
+    """Delivers images decoded in worker threads back to the GUI thread.
+
+    QPixmapCache may only be touched from the GUI thread, so workers decode
+    to QImage and the connected slot converts and inserts on the main thread.
+    """
+
+    image_decoded = pyqtSignal(str, QImage)
+
+
+_inflight_prefetches = set()
+
+
+def _insert_prefetched(cache_key, image):
+    """Convert a prefetched QImage to QPixmap and cache it (GUI thread)."""
+    _inflight_prefetches.discard(cache_key)
+    if not image.isNull():
+        QPixmapCache.insert(cache_key, QPixmap.fromImage(image))
+
+
+_prefetch_bridge = _PrefetchBridge()
+_prefetch_bridge.image_decoded.connect(
+    _insert_prefetched, Qt.ConnectionType.QueuedConnection
+)
+
+
+class _ThumbnailBridge(QObject):
+    """Delivers thumbnails decoded in worker threads back to the GUI thread."""
+
+    thumbnail_ready = pyqtSignal(int, object, int, QImage)
+
+
+# Bumped on every load_folder_images call so late thumbnails for a folder
+# that has since been cleared are dropped instead of touching dead items.
+_thumbnail_generation = 0
+
+
+def _set_thumbnail(generation, file_list, row, image):
+    """Install a decoded thumbnail on its list item (GUI thread)."""
+    if generation != _thumbnail_generation or image.isNull():
+        return
+    item = file_list.item(row)
+    if item is not None:
+        item.setIcon(QIcon(QPixmap.fromImage(image)))
+
+
+_thumbnail_bridge = _ThumbnailBridge()
+_thumbnail_bridge.thumbnail_ready.connect(
+    _set_thumbnail, Qt.ConnectionType.QueuedConnection
+)
+
+
+class ThumbnailTask(QRunnable):
+    """Decode one thumbnail off the GUI thread and hand it to the bridge."""
+
+    def __init__(self, file_path, row, generation, file_list):
+        super().__init__()
+        self.file_path = file_path
+        self.row = row
+        self.generation = generation
+        self.file_list = file_list
+
+    def run(self):
+        image = create_thumbnail_image(self.file_path)
+        _thumbnail_bridge.thumbnail_ready.emit(
+            self.generation, self.file_list, self.row, image
+        )
+
+
+class PrefetchTask(QRunnable):
+    """Decode and scale an image off the GUI thread.
+
+    QImageReader with setScaledSize decodes and scales JPEGs in one pass,
+    avoiding a full-resolution intermediate image.
+    """
+
+    def __init__(self, file_path, target_size, cache_key):
+        super().__init__()
+        self.file_path = file_path
+        self.target_size = target_size
+        self.cache_key = cache_key
+
+    def run(self):
+        reader = QImageReader(self.file_path)
+        # Match load_image exactly: both fill the same QPixmapCache key, so
+        # a prefetched entry must carry the same EXIF rotation or cached
+        # camera JPEGs would display sideways depending on which path won
+        reader.setAutoTransform(True)
+        size = reader.size()
+        if size.isValid():
+            size.scale(self.target_size, Qt.AspectRatioMode.KeepAspectRatio)
+            reader.setScaledSize(size)
+        _prefetch_bridge.image_decoded.emit(self.cache_key, reader.read())
+
+
+def prefetch_neighbour_images(image_files, current_index, image_label):
+    """Pre-decode the images around current_index into QPixmapCache.
+
+    Scheduled after showing an image so that sequential arrow-key browsing
+    finds the next/previous image already decoded.
+    """
+    if not image_files:
+        return
+
+    count = len(image_files)
+    for offset in (1, -1, 2, -2):
+        file_path = image_files[(current_index + offset) % count]
+        cache_key = f"{file_path}|{image_label.width()}x{image_label.height()}"
+        if cache_key in _inflight_prefetches:
+            continue
+        if QPixmapCache.find(cache_key, QPixmap()):
+            continue
+        _inflight_prefetches.add(cache_key)
+        QThreadPool.globalInstance().start(
+            PrefetchTask(file_path, image_label.size(), cache_key)
+        )
 
 
 def load_image(file_path, image_label):
-    """Load and display the image in the label."""
-    image = QPixmap(file_path)
-    scaled_image = image.scaled(
-        image_label.size(),
-        Qt.AspectRatioMode.KeepAspectRatio,
-        Qt.TransformationMode.SmoothTransformation,
-    )
+    """Load and display the image in the label.
+
+    Scaled pixmaps are cached in QPixmapCache keyed by path and label size,
+    so revisiting an image skips both the file decode and the smooth-scale.
+    On a cache miss the image is decoded through QImageReader with the
+    target size set, letting libjpeg stop decompression at the label
+    resolution instead of decoding the full-resolution image and then
+    down-scaling it.
+    """
+    key = f"{file_path}|{image_label.width()}x{image_label.height()}"
+    scaled_image = QPixmap()
+    if not QPixmapCache.find(key, scaled_image):
+        reader = QImageReader(file_path)
+        reader.setAutoTransform(True)
+        size = reader.size()
+        if size.isValid():
+            size.scale(image_label.size(), Qt.AspectRatioMode.KeepAspectRatio)
+            reader.setScaledSize(size)
+        if reader.read(_decode_buffer):
+            # fromImage copies into the platform pixmap, so the buffer can
+            # be reused for the next decode
+            scaled_image = QPixmap.fromImage(_decode_buffer)
+        QPixmapCache.insert(key, scaled_image)
     image_label.setPixmap(scaled_image)
 
 
+def append_new_folder_images(folder_path, file_list, known_files):
+    """Append images that appeared in the folder since known_files was built.
+
+    Used after a MegaDetector run, where only a handful of *_pred files are
+    new: existing items (and their thumbnails and indices) stay untouched
+    and only the delta is added.
+    """
+    known = set(known_files)
+    with os.scandir(folder_path) as entries:
+        new_files = sorted(
+            entry.path
+            for entry in entries
+            if _is_image_name(entry.name)
+            and entry.path not in known
+            and entry.is_file(follow_symlinks=False)
+        )
+    if not new_files:
+        return known_files
+
+    placeholder = _placeholder_icon()
+    start_row = file_list.count()
+    file_list.setUpdatesEnabled(False)
+    file_list.blockSignals(True)
+    try:
+        for offset, image_path in enumerate(new_files):
+            item = QListWidgetItem()
+            item.setIcon(placeholder)
+            item.setText(os.path.basename(image_path))
+            item.setData(Qt.ItemDataRole.UserRole, image_path)
+            file_list.addItem(item)
+            QThreadPool.globalInstance().start(
+                ThumbnailTask(
+                    image_path, start_row + offset, _thumbnail_generation, file_list
+                )
+            )
+    finally:
+        file_list.blockSignals(False)
+        file_list.setUpdatesEnabled(True)
+
+    return known_files + new_files
+
+
+def folder_fingerprint(folder_path):
+    """Cheap change-detection fingerprint for a folder's image listing.
+
+    Lets callers skip a full list rebuild when nothing changed, e.g. the
+    refresh that runs after every MegaDetector pass.
+    """
+    try:
+        dir_mtime = os.stat(folder_path).st_mtime_ns
+        with os.scandir(folder_path) as entries:
+            names = sorted(
+                entry.name for entry in entries if _is_image_name(entry.name)
+            )
+    except OSError:
+        return None
+    return (folder_path, dir_mtime, len(names), hash(tuple(names)))
+
+
 def load_folder_images(folder_path, file_list):
-    """Load all image files from the specified folder."""
-    image_extensions = (".png", ".jpg", ".jpeg", ".bmp", ".gif")
+    """Load all image files from the specified folder.
+
+    List items are added immediately with text only; thumbnails are decoded
+    in QThreadPool workers and swapped in as they arrive, so opening a big
+    folder no longer blocks the UI on one JPEG decode per file.
+    """
+    global _thumbnail_generation
+    _thumbnail_generation += 1
     file_list.clear()
-    image_files = [
-        os.path.join(folder_path, f)
-        for f in os.listdir(folder_path)
-        if os.path.splitext(f)[1].lower() in image_extensions
-    ]
+    # os.scandir carries a cached stat per entry, saving one syscall per file
+    # compared to os.listdir + os.path checks on large camera-trap folders.
+    with os.scandir(folder_path) as entries:
+        image_files = [
+            entry.path
+            for entry in entries
+            if _is_image_name(entry.name) and entry.is_file(follow_symlinks=False)
+        ]
     image_files.sort()
 
-    for image_path in image_files:
-        item = QListWidgetItem()
-        item.setIcon(QIcon(create_thumbnail(image_path)))
-        item.setText(os.path.basename(image_path))
-        item.setData(Qt.ItemDataRole.UserRole, image_path)
-        file_list.addItem(item)
+    # Suspend repaints and signals while inserting, so adding N items costs
+    # one layout pass instead of a relayout per addItem.
+    placeholder = _placeholder_icon()
+    file_list.setUpdatesEnabled(False)
+    file_list.blockSignals(True)
+    try:
+        for row, image_path in enumerate(image_files):
+            item = QListWidgetItem()
+            item.setIcon(placeholder)
+            item.setText(os.path.basename(image_path))
+            item.setData(Qt.ItemDataRole.UserRole, image_path)
+            file_list.addItem(item)
+            QThreadPool.globalInstance().start(
+                ThumbnailTask(image_path, row, _thumbnail_generation, file_list)
+            )
+    finally:
+        file_list.blockSignals(False)
+        file_list.setUpdatesEnabled(True)
 
     return image_files
@@ -10,9 +10,16 @@ from PyQt6.QtWidgets import (
     QApplication,
 )
 from PyQt6.QtCore import Qt, QSize
+from PyQt6.QtGui import QPixmapCache
 import logging
 from .folder_buttonwidget import FolderTab
-from .image_loader import load_image, load_folder_images
+from .image_loader import (
+    append_new_folder_images,
+    folder_fingerprint,
+    load_image,
+    load_folder_images,
+    prefetch_neighbour_images,
+)
 from .file_operations import copy_current_image_to_new_folder
 from .speciesnet_buttonwidget import SpeciesnetWidget
 from .megadetector_buttonwidget import MegaDetectorWidget
@@ -20,6 +27,14 @@ from .logs_window import LogHandler
 
 
 class MainWindow(QMainWindow):
+    # Copy-hotkey dispatch table: one dict lookup instead of a branch chain,
+    # and adding more destination folders stays a one-line change
+    KEY_TO_TAB = {
+        Qt.Key.Key_1: 0,
+        Qt.Key.Key_2: 1,
+        Qt.Key.Key_3: 2,
+    }
+
     def __init__(self):
         super().__init__()
         self.setWindowTitle("Image Viewer")
@@ -32,10 +47,15 @@ class MainWindow(QMainWindow):
         y = screen.y() + (screen.height() - window_height) // 2
         self.setGeometry(x, y, window_width, window_height)
 
+        # Allow the pixmap cache to hold a good number of scaled images (KB)
+        QPixmapCache.setCacheLimit(256 * 1024)
+
         # Initialize variables
         self.current_folder = None
         self.image_files = []
+        self.image_index_by_path = {}
         self.current_image_index = -1
+        self._folder_fingerprint = None
         self.new_folder_path = ["folder_1", "folder_2"]
 
         # Create menu bar
@@ -121,8 +141,6 @@ class MainWindow(QMainWindow):
         left_layout.addWidget(self.megadetector_button)
         left_layout.addStretch(1)
         left_stack.setLayout(left_layout)
-        # ensure the left_stack is aligned to the very left of the bottom area
-        left_layout.addStretch(1)
 
         # Bottom area: speciesnet button at left, folder tabs to the right
         bottom_container = QWidget()
@@ -185,7 +203,16 @@ class MainWindow(QMainWindow):
         if not self.current_folder:
             return
 
+        # Skip the rebuild entirely when the folder listing is unchanged,
+        # e.g. the refresh triggered after every MegaDetector run.
+        fingerprint = folder_fingerprint(self.current_folder)
+        if fingerprint is not None and fingerprint == self._folder_fingerprint:
+            self.logger.debug("Folder unchanged, skipping reload")
+            return
+        self._folder_fingerprint = fingerprint
+
         self.image_files = load_folder_images(self.current_folder, self.file_list)
+        self.image_index_by_path = {p: i for i, p in enumerate(self.image_files)}
         self.logger.info(f"Loaded {len(self.image_files)} images")
 
         if self.image_files:
@@ -198,6 +225,30 @@ class MainWindow(QMainWindow):
             self.image_label.setText("No images found in the selected folder")
             self.logger.warning("No images found in the selected folder")
 
+    def refresh_new_files(self):
+        """Append images added to the current folder since the last load.
+
+        Cheaper than load_folder_images after a MegaDetector run: only the
+        new prediction images are added instead of rebuilding every item.
+        """
+        if not self.current_folder:
+            return
+
+        before = len(self.image_files)
+        self.image_files = append_new_folder_images(
+            self.current_folder, self.file_list, self.image_files
+        )
+        self._folder_fingerprint = folder_fingerprint(self.current_folder)
+
+        added = len(self.image_files) - before
+        if added:
+            self.image_index_by_path = {p: i for i, p in enumerate(self.image_files)}
+            self.logger.info(f"Added {added} new images")
+            if self.current_image_index == -1:
+                self.current_image_index = 0
+                load_image(self.image_files[0], self.image_label)
+                self.file_list.setCurrentRow(0)
+
     def reload_folder(self):
         """Reload images from the current folder."""
         if not self.current_folder:
@@ -210,13 +261,15 @@ class MainWindow(QMainWindow):
             current_file = self.image_files[self.current_image_index]
 
         self.logger.info(f"Reloading folder: {self.current_folder}")
+        self._folder_fingerprint = folder_fingerprint(self.current_folder)
         self.image_files = load_folder_images(self.current_folder, self.file_list)
+        self.image_index_by_path = {p: i for i, p in enumerate(self.image_files)}
         self.logger.info(f"Reloaded {len(self.image_files)} images")
 
         if self.image_files:
             # Try to restore the previously selected image
-            if current_file and current_file in self.image_files:
-                self.current_image_index = self.image_files.index(current_file)
+            if current_file and current_file in self.image_index_by_path:
+                self.current_image_index = self.image_index_by_path[current_file]
             else:
                 self.current_image_index = 0
 
@@ -233,34 +286,21 @@ class MainWindow(QMainWindow):
             self.next_image()
         elif event.key() == Qt.Key.Key_Left or event.key() == Qt.Key.Key_Up:
             self.previous_image()
-        elif event.key() == Qt.Key.Key_1:
-            tab = self.tabs.widget(0)
-            if tab and tab.get_folder_path():
-                self.logger.info(f"Copying to folder 1: {tab.get_folder_path()}")
-                copy_current_image_to_new_folder(
-                    tab.get_folder_path(), self.image_files, self.current_image_index
-                )
-        elif event.key() == Qt.Key.Key_2:
-            tab = self.tabs.widget(1)
-            if tab and tab.get_folder_path():
-                self.logger.info(f"Copying to folder 2: {tab.get_folder_path()}")
+        elif (tab_index := self.KEY_TO_TAB.get(event.key())) is not None:
+            tab = self.tabs.widget(tab_index)
+            folder_path = tab.get_folder_path() if tab else None
+            if folder_path:
+                self.logger.info(f"Copying to folder {tab_index + 1}: {folder_path}")
                 copy_current_image_to_new_folder(
-                    tab.get_folder_path(), self.image_files, self.current_image_index
-                )
-        elif event.key() == Qt.Key.Key_3:
-            tab = self.tabs.widget(2)
-            if tab and tab.get_folder_path():
-                self.logger.info(f"Copying to folder 3: {tab.get_folder_path()}")
-                copy_current_image_to_new_folder(
-                    tab.get_folder_path(), self.image_files, self.current_image_index
+                    folder_path, self.image_files, self.current_image_index
                 )
         else:
             super().keyPressEvent(event)
 
     def on_file_selected(self, item):
         file_path = item.data(Qt.ItemDataRole.UserRole)
-        self.current_image_index = self.image_files.index(file_path)
-        self.logger.debug(f"Selected image: {file_path}")
+        self.current_image_index = self.image_index_by_path[file_path]
+        self.logger.debug("Selected image: %s", file_path)
         load_image(file_path, self.image_label)
 
     def next_image(self):
@@ -270,9 +310,12 @@ class MainWindow(QMainWindow):
         self.current_image_index = (self.current_image_index + 1) % len(
             self.image_files
         )
-        self.logger.debug(f"Next image: {self.image_files[self.current_image_index]}")
+        self.logger.debug("Next image: %s", self.image_files[self.current_image_index])
         load_image(self.image_files[self.current_image_index], self.image_label)
         self.file_list.setCurrentRow(self.current_image_index)
+        prefetch_neighbour_images(
+            self.image_files, self.current_image_index, self.image_label
+        )
 
     def closeEvent(self, event):
         """Handle application close event to ensure worker threads are properly terminated."""
@@ -281,7 +324,6 @@ class MainWindow(QMainWindow):
             if self.speciesnet_widget.worker.isRunning():
                 self.logger.info("Terminating SpeciesNet worker...")
                 self.speciesnet_widget.worker.terminate_process()
-                self.speciesnet_widget.worker.quit()
                 if not self.speciesnet_widget.worker.wait(2000):
                     self.logger.warning("SpeciesNet worker did not terminate in time")
 
@@ -293,10 +335,15 @@ class MainWindow(QMainWindow):
             if self.megadetector_button.worker.isRunning():
                 self.logger.info("Terminating MegaDetector worker...")
                 self.megadetector_button.worker.terminate_process()
-                self.megadetector_button.worker.quit()
                 if not self.megadetector_button.worker.wait(2000):
                     self.logger.warning("MegaDetector worker did not terminate in time")
 
+        # Shut down the persistent server processes
+        if hasattr(self.speciesnet_widget, "server"):
+            self.speciesnet_widget.server.terminate()
+        if hasattr(self.megadetector_button, "server"):
+            self.megadetector_button.server.terminate()
+
         self.logger.info("Application closing")
         event.accept()
 
@@ -308,7 +355,10 @@ class MainWindow(QMainWindow):
             self.image_files
         )
         self.logger.debug(
-            f"Previous image: {self.image_files[self.current_image_index]}"
+            "Previous image: %s", self.image_files[self.current_image_index]
         )
         load_image(self.image_files[self.current_image_index], self.image_label)
         self.file_list.setCurrentRow(self.current_image_index)
+        prefetch_neighbour_images(
+            self.image_files, self.current_image_index, self.image_label
+        )
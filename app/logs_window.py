@@ -3,32 +3,57 @@ from PyQt6.QtCore import Qt, QObject, pyqtSignal
 
 
 class LogHandler(logging.Handler, QObject):
-    """Custom logging handler that emits to a QTextEdit widget in a thread-safe manner."""
+    """Custom logging handler that emits to a QTextEdit widget in a thread-safe manner.
 
-    log_message = pyqtSignal(str)
+    Records are buffered and flushed in batches: the first record of a burst
+    schedules one queued flush, and every record logged before the GUI thread
+    gets around to it joins the same insertPlainText call. A chatty subprocess
+    emitting a line per image thus costs one repaint per event-loop turn
+    instead of one per record.
+    """
+
+    log_message = pyqtSignal()
 
     def __init__(self, text_edit):
         logging.Handler.__init__(self)
         QObject.__init__(self)
         self.text_edit = text_edit
+        # Bound the document so heavy logging cannot grow repaint cost forever
+        self.text_edit.document().setMaximumBlockCount(5000)
+        self._pending = []
+        self._flush_scheduled = False
         # Connect signal to slot in the main GUI thread
         self.log_message.connect(
-            self._append_message, Qt.ConnectionType.QueuedConnection
+            self._flush_pending, Qt.ConnectionType.QueuedConnection
         )
 
     def emit(self, record):
-        """Emit a log record to the QTextEdit widget via signal (thread-safe)."""
+        """Buffer a log record and schedule a flush on the GUI thread."""
         try:
             msg = self.format(record)
-            # Use signal to ensure GUI update happens in main thread
-            self.log_message.emit(msg)
+            # handle() already holds the handler lock around emit()
+            self._pending.append(msg)
+            if not self._flush_scheduled:
+                self._flush_scheduled = True
+                self.log_message.emit()
         except Exception:
             self.handleError(record)
 
-    def _append_message(self, msg):
-        """Append message to text edit (called in main GUI thread)."""
+    def _flush_pending(self):
+        """Append all buffered messages to the text edit (main GUI thread)."""
+        self.acquire()
+        try:
+            batch = self._pending
+            self._pending = []
+            self._flush_scheduled = False
+        finally:
+            self.release()
+
+        if not batch:
+            return
+
         try:
-            self.text_edit.insertPlainText(msg + "\n")
+            self.text_edit.insertPlainText("\n".join(batch) + "\n")
             # Auto-scroll to bottom
             scrollbar = self.text_edit.verticalScrollBar()
             scrollbar.setValue(scrollbar.maximum())
@@ -9,7 +9,9 @@ from PyQt6.QtWidgets import (
 from PyQt6.QtCore import Qt
 import os
 import logging
-from .worker import SpeciesnetWorker
+from .worker import MegadetectorServer, ServerJobWorker
+
+logger = logging.getLogger("ImageViewer")
 
 
 class MegaDetectorWidget(QWidget):
@@ -23,7 +25,9 @@ class MegaDetectorWidget(QWidget):
         self.folder_path = ""
         self.folder_name = name
         self.worker = None
-        self.logger = logging.getLogger("ImageViewer")
+        # Lazily started on first run, then reused so interpreter boot and
+        # package imports are paid once instead of per click
+        self.server = MegadetectorServer()
 
         vlayout = QVBoxLayout()
         vlayout.addStretch()  # push buttons to the bottom row
@@ -39,6 +43,10 @@ class MegaDetectorWidget(QWidget):
         self.setLayout(vlayout)
 
     def on_run_clicked(self):
+        # Disable first thing: a rapid double-click must not queue a second
+        # job before the first one's checks complete
+        self.run_button.setEnabled(False)
+
         window = self.window()
         folder = None
         if window and hasattr(window, "current_folder") and window.current_folder:
@@ -49,13 +57,15 @@ class MegaDetectorWidget(QWidget):
                 self, "Select folder to run MegaDetector on"
             )
             if not folder:
+                self.run_button.setEnabled(True)
                 return
 
         predictions_json = os.path.join(folder, "predictions.json")
         if not os.path.isfile(predictions_json):
             msg = f"No predictions.json found in folder:\n{folder}"
             QMessageBox.warning(self, "MegaDetector", msg)
-            self.logger.warning(msg)
+            logger.warning(msg)
+            self.run_button.setEnabled(True)
             return
 
         # prepare output folder for visualization
@@ -69,31 +79,21 @@ class MegaDetectorWidget(QWidget):
             QMessageBox.critical(
                 self, "MegaDetector", f"Failed to create output directory:\n{e}"
             )
-            self.logger.error(f"Failed to create output directory {output_dir}: {e}")
+            logger.error(f"Failed to create output directory {output_dir}: {e}")
+            self.run_button.setEnabled(True)
             return
 
-        # command to run megadetector visualization
-        cmd = [
-            "python",
-            "-m",
-            "megadetector.visualization.visualize_detector_output",
-            predictions_json,
-            output_dir,
-        ]
-
         # Stop any existing worker first
         if self.worker and self.worker.isRunning():
-            self.logger.warning("Stopping previous MegaDetector worker...")
+            logger.warning("Stopping previous MegaDetector worker...")
             self.worker.terminate_process()
-            self.worker.quit()
             self.worker.wait(2000)
             self.worker = None
 
         try:
-            # reuse SpeciesnetWorker that captures stdout/stderr and emits signals
-            self.worker = SpeciesnetWorker(cmd, folder, task_name="MegaDetector")
-            # Set parent to ensure proper cleanup
-            self.worker.setParent(self)
+            # queue the job on the persistent server and follow its output
+            self.server.submit({"predictions": predictions_json, "output": output_dir})
+            self.worker = ServerJobWorker(self.server, folder, task_name="MegaDetector")
             self.worker.output_signal.connect(
                 self.on_output, Qt.ConnectionType.QueuedConnection
             )
@@ -103,31 +103,31 @@ class MegaDetectorWidget(QWidget):
             self.worker.finished_signal.connect(
                 self.on_finished, Qt.ConnectionType.QueuedConnection
             )
-            # Don't delete the worker - keep it alive to prevent segfaults
-            # Qt will clean it up when the parent widget is destroyed
+            # self.worker keeps the runnable (and its signals) alive;
+            # start() submits it to the shared global thread pool
             self.worker.start()
 
-            self.run_button.setEnabled(False)
-            self.logger.info(f"MegaDetector process started for: {folder}")
+            logger.info(f"MegaDetector process started for: {folder}")
         except Exception as e:
             error_msg = f"Failed to start MegaDetector: {str(e)}"
             QMessageBox.critical(self, "MegaDetector Error", error_msg)
-            self.logger.error(error_msg)
+            logger.error(error_msg)
+            self.run_button.setEnabled(True)
 
     def on_output(self, message):
         """Handle output lines from the worker."""
-        self.logger.info(message)
+        logger.info(message)
 
     def on_error(self, message):
         """Handle error output from the worker."""
-        self.logger.error(message)
+        logger.error(message)
 
     def on_finished(self):
         """Re-enable button when finished and rename output files."""
         try:
             if self.run_button and not self.run_button.isHidden():
                 self.run_button.setEnabled(True)
-            self.logger.info("MegaDetector process finished")
+            logger.info("MegaDetector process finished")
 
             # Attempt to rename output files produced by MegaDetector
             try:
@@ -145,25 +145,29 @@ class MegaDetectorWidget(QWidget):
                         )
                 if output_dir:
                     self.rename_output_files(output_dir)
-                    self.logger.info("Renamed MegaDetector output files (if any).")
+                    logger.info("Renamed MegaDetector output files (if any).")
                 else:
-                    self.logger.debug(
+                    logger.debug(
                         "No folder available to rename MegaDetector output files."
                     )
             except Exception as e:
-                self.logger.error(f"Error renaming MegaDetector output files: {e}")
+                logger.error(f"Error renaming MegaDetector output files: {e}")
 
-            # Load images from the processed folder
+            # Pick up the new prediction images from the processed folder
             window = self.window()
-            if window and hasattr(window, "load_folder_images") and self.worker:
+            if window and hasattr(window, "refresh_new_files") and self.worker:
                 folder = self.worker.folder
                 if folder:
-                    window.current_folder = folder
-                    window.load_folder_images()
-                    self.logger.info(f"Loaded images from processed folder: {folder}")
+                    if window.current_folder == folder:
+                        # Same folder: append only the new files
+                        window.refresh_new_files()
+                    else:
+                        window.current_folder = folder
+                        window.load_folder_images()
+                    logger.info(f"Loaded images from processed folder: {folder}")
         except RuntimeError as e:
             # Widget was deleted
-            self.logger.debug(f"Widget deleted during on_finished: {e}")
+            logger.debug(f"Widget deleted during on_finished: {e}")
 
     def rename_output_files(self, folder):
         """Rename files in megadetector_output so only the part after the last '~' remains,
@@ -172,22 +176,27 @@ class MegaDetectorWidget(QWidget):
         """
         output_dir = folder
         if not os.path.isdir(output_dir):
-            self.logger.warning(
+            logger.warning(
                 f"rename_output_files: output directory not found: {output_dir}"
             )
             return
 
-        for fname in os.listdir(output_dir):
-            src_path = os.path.join(output_dir, fname)
-            if not os.path.isfile(src_path):
-                continue
+        # Snapshot the directory once; collision probing against the set is
+        # in-memory instead of one os.path.exists stat per candidate name.
+        with os.scandir(output_dir) as it:
+            entries = [e for e in it if e.is_file(follow_symlinks=False)]
+        existing = {e.name for e in entries}
+
+        for entry in entries:
+            fname = entry.name
+            src_path = entry.path
 
             if "~" not in fname:
                 continue
 
             raw_name = fname.split("~")[-1].strip()
             if not raw_name:
-                self.logger.debug(
+                logger.debug(
                     f"Skipping rename for {fname}: empty target name after '~'"
                 )
                 continue
@@ -196,17 +205,18 @@ class MegaDetectorWidget(QWidget):
             # add '_pred' postfix to the base name
             base_pred = f"{base}_pred"
             dst_name = f"{base_pred}{ext}"
-            dst_path = os.path.join(output_dir, dst_name)
 
             # avoid overwriting existing files by adding numeric suffix
             counter = 1
-            while os.path.exists(dst_path):
+            while dst_name in existing:
                 dst_name = f"{base_pred}_{counter}{ext}"
-                dst_path = os.path.join(output_dir, dst_name)
                 counter += 1
+            dst_path = os.path.join(output_dir, dst_name)
 
             try:
                 os.rename(src_path, dst_path)
-                self.logger.info(f"Renamed '{fname}' -> '{os.path.basename(dst_path)}'")
+                existing.discard(fname)
+                existing.add(dst_name)
+                logger.info(f"Renamed '{fname}' -> '{os.path.basename(dst_path)}'")
             except Exception as e:
-                self.logger.error(f"Failed to rename '{src_path}' -> '{dst_path}': {e}")
+                logger.error(f"Failed to rename '{src_path}' -> '{dst_path}': {e}")
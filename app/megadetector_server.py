@@ -0,0 +1,39 @@
+"""Long-lived MegaDetector visualization process.
+
+Started once by MegaDetectorWidget and reused across runs, so interpreter
+start-up and the heavy megadetector/torch imports are paid on the first
+visualization only instead of on every click.
+
+Protocol: one JSON object per stdin line with "predictions" and "output"
+keys. Progress is echoed on stdout and each job ends with a
+"__JOB_DONE__ <returncode>" status line.
+"""
+
+import json
+import sys
+
+JOB_DONE_PREFIX = "__JOB_DONE__"
+
+
+def main():
+    for line in sys.stdin:
+        line = line.strip()
+        if not line:
+            continue
+        try:
+            job = json.loads(line)
+            # Imported here (once, cached afterwards) so a malformed job
+            # cannot kill the server before it reports the failure.
+            from megadetector.visualization.visualize_detector_output import (
+                visualize_detector_output,
+            )
+
+            visualize_detector_output(job["predictions"], job["output"])
+            print(f"{JOB_DONE_PREFIX} 0", flush=True)
+        except Exception as e:
+            print(f"Visualization failed: {e}", flush=True)
+            print(f"{JOB_DONE_PREFIX} 1", flush=True)
+
+
+if __name__ == "__main__":
+    main()
@@ -8,10 +8,10 @@ from PyQt6.QtWidgets import (
 )
 from PyQt6.QtCore import Qt
 import os
-import sys
 import logging
-from glob import glob
-from .worker import SpeciesnetWorker
+from .worker import ServerJobWorker, SpeciesnetServer
+
+logger = logging.getLogger("ImageViewer")
 
 
 class SpeciesnetWidget(QWidget):
@@ -25,7 +25,9 @@ class SpeciesnetWidget(QWidget):
         self.folder_path = ""
         self.folder_name = name
         self.worker = None
-        self.logger = logging.getLogger("ImageViewer")
+        # Lazily started on first run, then reused so the torch import and
+        # model weights load are paid once instead of per click
+        self.server = SpeciesnetServer()
 
         # Main vertical layout: stretch, then a horizontal layout containing button on the left
         vlayout = QVBoxLayout()
@@ -42,6 +44,10 @@ class SpeciesnetWidget(QWidget):
         self.setLayout(vlayout)
 
     def on_run_clicked(self):
+        # Disable first thing: a rapid double-click must not queue a second
+        # job before the first one's checks complete
+        self.run_button.setEnabled(False)
+
         # Try to use MainWindow.current_folder if available
         window = self.window()
         folder = None
@@ -53,38 +59,30 @@ class SpeciesnetWidget(QWidget):
                 self, "Select folder to run SpeciesNet on"
             )
             if not folder:
+                self.run_button.setEnabled(True)
                 return
 
         predictions_json = os.path.join(folder, "predictions.json")
 
-        image_files = ",".join(glob(os.path.join(folder, "*.JPG")))
-
         # Stop any existing worker first
         if self.worker and self.worker.isRunning():
-            self.logger.warning("Stopping previous SpeciesNet worker...")
+            logger.warning("Stopping previous SpeciesNet worker...")
             self.worker.terminate_process()
-            self.worker.quit()
             self.worker.wait(2000)
             self.worker = None
 
         try:
-            cmd = [
-                sys.executable,
-                "-m",
-                "speciesnet.scripts.run_model",
-                # "--folders", folder,
-                "--filepaths",
-                image_files,
-                "--predictions_json",
-                predictions_json,
-                "country",
-                "NL",
-            ]
-
-            # Create and start worker thread
-            self.worker = SpeciesnetWorker(cmd, folder)
-            # Set parent to ensure proper cleanup
-            self.worker.setParent(self)
+            # queue the job on the persistent server and follow its output;
+            # the server enumerates the folder itself (case-insensitively),
+            # keeping the O(N) listing out of the GUI process
+            self.server.submit(
+                {
+                    "folder": folder,
+                    "predictions_json": predictions_json,
+                    "country": "NL",
+                }
+            )
+            self.worker = ServerJobWorker(self.server, folder, task_name="SpeciesNet")
             self.worker.output_signal.connect(
                 self.on_output, Qt.ConnectionType.QueuedConnection
             )
@@ -94,17 +92,17 @@ class SpeciesnetWidget(QWidget):
             self.worker.finished_signal.connect(
                 self.on_finished, Qt.ConnectionType.QueuedConnection
             )
-            # Don't delete the worker - keep it alive to prevent segfaults
-            # Qt will clean it up when the parent widget is destroyed
+            # self.worker keeps the runnable (and its signals) alive;
+            # start() submits it to the shared global thread pool
             self.worker.start()
 
-            self.run_button.setEnabled(False)
-            self.logger.info(f"SpeciesNet process started for: {folder}")
+            logger.info(f"SpeciesNet process started for: {folder}")
 
         except Exception as e:
             error_msg = f"Failed to start SpeciesNet: {str(e)}"
             QMessageBox.critical(self, "SpeciesNet Error", error_msg)
-            self.logger.error(error_msg)
+            logger.error(error_msg)
+            self.run_button.setEnabled(True)
 
     def on_output(self, message):
         """Handle output from SpeciesNet process."""
@@ -119,7 +117,7 @@ class SpeciesnetWidget(QWidget):
         try:
             if self.run_button and not self.run_button.isHidden():
                 self.run_button.setEnabled(True)
-            self.logger.info("SpeciesNet process finished")
+            logger.info("SpeciesNet process finished")
 
             # Load images from the processed folder
             window = self.window()
@@ -128,7 +126,7 @@ class SpeciesnetWidget(QWidget):
                 if folder:
                     window.current_folder = folder
                     window.load_folder_images()
-                    self.logger.info(f"Loaded images from processed folder: {folder}")
+                    logger.info(f"Loaded images from processed folder: {folder}")
         except RuntimeError as e:
             # Widget was deleted
-            self.logger.debug(f"Widget deleted during on_finished: {e}")
+            logger.debug(f"Widget deleted during on_finished: {e}")
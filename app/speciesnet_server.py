@@ -0,0 +1,72 @@
+"""Long-lived SpeciesNet inference process.
+
+Started once by SpeciesnetWidget and reused across runs: interpreter
+start-up, the torch import and the model weights load (the dominant cost,
+tens of seconds) are all paid on the first run only.
+
+Protocol: one JSON object per stdin line with "predictions_json", either
+"folder" or "filepaths", and an optional "country" key. Progress is echoed
+on stdout and each job ends with a "__JOB_DONE__ <returncode>" status line.
+"""
+
+import json
+import os
+import sys
+
+JOB_DONE_PREFIX = "__JOB_DONE__"
+
+
+def _job_filepaths(job):
+    """Resolve a job's image list.
+
+    Jobs normally carry just a folder — enumerating here keeps the O(N)
+    listing and the megabytes of path strings out of the GUI process — but
+    an explicit "filepaths" list is honoured for callers that pre-filter.
+    """
+    if "filepaths" in job:
+        return job["filepaths"]
+    with os.scandir(job["folder"]) as entries:
+        return sorted(
+            entry.path
+            for entry in entries
+            if entry.name.lower().endswith((".jpg", ".jpeg"))
+            and entry.is_file(follow_symlinks=False)
+        )
+
+
+def main():
+    model = None
+    for line in sys.stdin:
+        line = line.strip()
+        if not line:
+            continue
+        try:
+            job = json.loads(line)
+            if model is None:
+                from speciesnet import DEFAULT_MODEL, SpeciesNet
+
+                print("Loading SpeciesNet model...", flush=True)
+                model = SpeciesNet(DEFAULT_MODEL)
+                print("SpeciesNet model loaded", flush=True)
+
+            country = job.get("country", "NL")
+            instances = {
+                "instances": [
+                    {"filepath": filepath, "country": country}
+                    for filepath in _job_filepaths(job)
+                ]
+            }
+            model.predict(
+                instances_dict=instances,
+                run_mode="multi_thread",
+                progress_bars=False,
+                predictions_json=job["predictions_json"],
+            )
+            print(f"{JOB_DONE_PREFIX} 0", flush=True)
+        except Exception as e:
+            print(f"SpeciesNet failed: {e}", flush=True)
+            print(f"{JOB_DONE_PREFIX} 1", flush=True)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,8 +1,62 @@
+import hashlib
 import os
-from glob import glob
 import kagglehub
 import urllib.request
 
+MEGADETECTOR_URL = (
+    "https://github.com/agentmorris/MegaDetector/releases/download/v5.0/md_v5a.0.0.pt"
+)
+# Pin here once a trusted digest for the v5.0 release asset is recorded;
+# None skips verification but the digest is still computed and printed.
+MEGADETECTOR_SHA256 = None
+
+
+def _download(url, dest_path, expected_sha256=None):
+    """Stream a download to disk in 1 MiB chunks, hashing as it goes.
+
+    Large chunks keep the syscall count low (~280 for the MegaDetector
+    weights versus ~36000 with urlretrieve's 8 KiB blocks) and the inline
+    SHA-256 gives an integrity check without a second read of the file.
+    """
+    digest = hashlib.sha256()
+    with urllib.request.urlopen(url) as response, open(dest_path, "wb") as out:
+        for chunk in iter(lambda: response.read(1 << 20), b""):
+            out.write(chunk)
+            digest.update(chunk)
+    hexdigest = digest.hexdigest()
+    print("Downloaded", dest_path, "sha256:", hexdigest)
+    if expected_sha256 is not None and hexdigest != expected_sha256:
+        os.remove(dest_path)
+        raise ValueError(
+            f"Checksum mismatch for {url}: got {hexdigest}, expected {expected_sha256}"
+        )
+    return dest_path
+
+
+def _remote_size(url):
+    """Content-Length reported by a HEAD request, or None if unavailable."""
+    try:
+        request = urllib.request.Request(url, method="HEAD")
+        with urllib.request.urlopen(request) as response:
+            return int(response.headers["Content-Length"])
+    except (OSError, TypeError, ValueError):
+        return None
+
+
+def _megadetector_is_current(weight_path):
+    """Check the local MegaDetector weights with one stat and a HEAD request.
+
+    A partial download (size mismatch against the release asset) counts as
+    missing so it gets re-fetched.
+    """
+    if not os.path.isfile(weight_path):
+        return False
+    remote_size = _remote_size(MEGADETECTOR_URL)
+    if remote_size is not None and os.path.getsize(weight_path) != remote_size:
+        print("MegaDetector weights size mismatch, re-downloading")
+        return False
+    return True
+
 
 def main() -> None:
     # Override default weight local cache directory
@@ -11,11 +65,7 @@ def main() -> None:
     )
     print("Weights will be stored in:", weight_dir)
 
-    # Recursive search for pt files to check if they already exist
-    result = [y for x in os.walk(weight_dir) for y in glob(os.path.join(x[0], "*.pt"))]
-    print(result)
-
-    if not os.path.exists(weight_dir + "models/speciesnet.pt"):
+    if not os.path.isfile(weight_dir + "models/speciesnet.pt"):
         # Download latest version
         speciesnet_path = kagglehub.model_download(
             "google/speciesnet/pyTorch/v4.0.2b",
@@ -31,10 +81,11 @@ def main() -> None:
             + "models/speciesnet.pt"
         )
         os.environ["SPECIESNET_WEIGHTS_PATH"] = weight_dir + "models/speciesnet.pt"
-    if not os.path.exists(weight_dir + "models/megadetector.pt"):
-        megadetector_path = urllib.request.urlretrieve(
-            "https://github.com/agentmorris/MegaDetector/releases/download/v5.0/md_v5a.0.0.pt",
+    if not _megadetector_is_current(weight_dir + "models/megadetector.pt"):
+        megadetector_path = _download(
+            MEGADETECTOR_URL,
             weight_dir + "models/megadetector.pt",
+            expected_sha256=MEGADETECTOR_SHA256,
         )
         os.environ["MEGADETECTOR_WEIGHTS_PATH"] = megadetector_path
         print("Path to megadetector model files:", megadetector_path)
@@ -1,52 +1,177 @@
-from PyQt6.QtCore import QThread, pyqtSignal
+from PyQt6.QtCore import QObject, QRunnable, QThreadPool, pyqtSignal
+import json
+import os
+import queue
+import selectors
 import subprocess
+import sys
+import threading
+import time
 import logging
 
+from .megadetector_server import JOB_DONE_PREFIX
 
-class SpeciesnetWorker(QThread):
-    """Worker thread to run subprocess commands without blocking the UI."""
+# Resolved once at import: getLogger takes a lock and walks the logger
+# hierarchy, which per-instance lookups would repeat on every construction
+logger = logging.getLogger("ImageViewer")
+
+
+class _WorkerSignals(QObject):
+    """Signal holder for pooled workers (QRunnable is not a QObject)."""
 
     output_signal = pyqtSignal(str)
     error_signal = pyqtSignal(str)
     finished_signal = pyqtSignal()
 
-    def __init__(self, cmd, folder, task_name="SpeciesNet"):
+
+class _PooledWorker(QRunnable):
+    """Base for workers executed on the shared global thread pool.
+
+    Submitting to QThreadPool.globalInstance() reuses pooled threads
+    instead of spawning a fresh QThread per click, and bounds the number
+    of concurrent worker threads to the pool size. The start/isRunning/
+    wait shims keep the QThread-era surface so callers are unchanged.
+    """
+
+    def __init__(self, task_name):
         super().__init__()
+        self.setAutoDelete(False)  # callers keep a reference across runs
+        self.signals = _WorkerSignals()
+        # Bound-signal aliases preserve worker.output_signal.connect(...)
+        self.output_signal = self.signals.output_signal
+        self.error_signal = self.signals.error_signal
+        self.finished_signal = self.signals.finished_signal
+        self.task_name = task_name
+        self._started = False
+        self._done = threading.Event()
+
+    def start(self):
+        """Submit this worker to the shared pool."""
+        self._started = True
+        self._done.clear()
+        QThreadPool.globalInstance().start(self)
+
+    def isRunning(self):
+        """True while run() is executing (or queued) on the pool."""
+        return self._started and not self._done.is_set()
+
+    def wait(self, msecs=None):
+        """Block until run() finishes; returns False on timeout."""
+        if not self._started:
+            return True
+        return self._done.wait(None if msecs is None else msecs / 1000)
+
+
+class SpeciesnetWorker(_PooledWorker):
+    """Pooled worker to run subprocess commands without blocking the UI."""
+
+    def __init__(self, cmd, folder, task_name="SpeciesNet"):
+        super().__init__(task_name)
         self.cmd = cmd
         self.folder = folder
-        self.task_name = task_name
-        self.logger = logging.getLogger("ImageViewer")
         self.process = None
+        self._stop_requested = False
 
     def run(self):
         try:
             self.output_signal.emit(
                 f"Starting {self.task_name} on folder: {self.folder}"
             )
-            self.logger.info(f"Starting {self.task_name} on folder: {self.folder}")
+            logger.info(f"Starting {self.task_name} on folder: {self.folder}")
 
             # Run subprocess with output capture
             # start_new_session=True isolates the subprocess from parent's signal handlers
+            # Binary pipe: text=True would route every read through a
+            # TextIOWrapper with per-line UTF-8 decoding; raw os.read plus
+            # one decode per emitted line keeps the reader thread ahead of
+            # a chatty child process.
             self.process = subprocess.Popen(
                 self.cmd,
                 stdout=subprocess.PIPE,
                 stderr=subprocess.STDOUT,  # Redirect stderr to stdout
-                text=True,
+                bufsize=65536,  # drain a large buffer per read syscall
                 start_new_session=True,
                 close_fds=True,  # Close file descriptors in child process
             )
 
-            # Read output in real-time
-            while True:
-                if not self.isRunning():
-                    # Thread was requested to stop
-                    break
-                output = self.process.stdout.readline()
-                if output == "" and self.process.poll() is not None:
-                    break
+            # Read output in real-time. A daemon thread drains the pipe in
+            # 64 KiB chunks, splits lines itself and feeds a queue, so this
+            # loop waits on an OS-backed queue instead of pinning the worker
+            # thread inside a read; stop requests are honoured within the
+            # get() timeout.
+            output_queue = queue.Queue()
+
+            def _drain_stdout(stream, lines):
+                fd = stream.fileno()
+                buf = bytearray()
+                # Multiplex instead of blocking in os.read: a stop request
+                # is noticed within the select timeout even when the child
+                # produces no output, so the thread never outlives shutdown.
+                sel = selectors.DefaultSelector()
+                sel.register(stream, selectors.EVENT_READ)
+                try:
+                    while True:
+                        if not sel.select(timeout=0.1):
+                            if self._stop_requested:
+                                break
+                            continue
+                        data = os.read(fd, 65536)
+                        if not data:
+                            break
+                        buf += data
+                        while True:
+                            newline = buf.find(b"\n")
+                            if newline < 0:
+                                break
+                            lines.put(bytes(buf[:newline]))
+                            del buf[: newline + 1]
+                finally:
+                    sel.close()
+                if buf:
+                    lines.put(bytes(buf))
+                lines.put(None)  # EOF sentinel
+
+            reader = threading.Thread(
+                target=_drain_stdout,
+                args=(self.process.stdout, output_queue),
+                daemon=True,
+            )
+            reader.start()
+
+            # Coalesce output lines: flood output (a progress line per
+            # image) is emitted as one queued signal per 32 lines / 50 ms
+            # instead of one cross-thread marshalling per line.
+            pending = []
+            last_flush = time.monotonic()
+            eof = False
+
+            while not self._stop_requested and not eof:
+                try:
+                    output = output_queue.get(timeout=0.05)
+                except queue.Empty:
+                    # Nothing queued yet; fall through so stale pending
+                    # lines still flush on the time threshold. EOF is only
+                    # ever the reader's None sentinel — exiting on poll()
+                    # here would drop lines (e.g. a final traceback) the
+                    # reader enqueues after the process has exited.
+                    output = b""
+                if output is None:
+                    # EOF sentinel from the reader thread
+                    eof = True
+                    output = b""
+                # Decode lazily, one complete line at a time
+                output = output.decode("utf-8", errors="replace").strip()
                 if output:
-                    self.output_signal.emit(output.strip())
-                    self.logger.info(output.strip())
+                    pending.append(output)
+                    logger.info(output)
+                now = time.monotonic()
+                if pending and (eof or len(pending) >= 32 or now - last_flush > 0.05):
+                    self.output_signal.emit("\n".join(pending))
+                    pending.clear()
+                    last_flush = now
+
+            if pending:
+                self.output_signal.emit("\n".join(pending))
 
             # Wait for process to complete
             self.process.wait()
@@ -54,23 +179,25 @@ class SpeciesnetWorker(QThread):
             return_code = self.process.returncode
             if return_code == 0:
                 self.output_signal.emit(f"{self.task_name} completed successfully")
-                self.logger.info(f"{self.task_name} completed successfully")
+                logger.info(f"{self.task_name} completed successfully")
             else:
                 error_msg = f"{self.task_name} exited with code {return_code}"
                 self.error_signal.emit(error_msg)
-                self.logger.error(error_msg)
+                logger.error(error_msg)
 
         except Exception as e:
             error_msg = f"Failed to run {self.task_name}: {str(e)}"
             self.error_signal.emit(error_msg)
-            self.logger.error(error_msg)
+            logger.error(error_msg)
         finally:
-            # Ensure signals are emitted before thread exits
+            # Ensure signals are emitted before the pool thread moves on
             self.finished_signal.emit()
-            self.logger.info(f"{self.task_name} finished_signal emitted")
+            logger.info(f"{self.task_name} finished_signal emitted")
+            self._done.set()
 
     def terminate_process(self):
         """Terminate the subprocess if it's still running."""
+        self._stop_requested = True
         if self.process and self.process.poll() is None:
             try:
                 self.process.terminate()
@@ -78,4 +205,134 @@ class SpeciesnetWorker(QThread):
             except subprocess.TimeoutExpired:
                 self.process.kill()
             except Exception as e:
-                self.logger.error(f"Error terminating process: {e}")
+                logger.error(f"Error terminating process: {e}")
+
+
+class PersistentServer:
+    """Owns a long-lived worker subprocess fed JSON jobs over stdin.
+
+    Spawning a fresh interpreter per run pays interpreter boot, package
+    import (numpy, torch, pillow) and — for SpeciesNet — the model weights
+    load every time. Keeping one warm server process amortises that fixed
+    cost across runs.
+    """
+
+    def __init__(self, module, task_name):
+        self.module = module
+        self.task_name = task_name
+        self.process = None
+
+    def ensure_started(self):
+        """Start (or restart) the server process if it is not running."""
+        if self.process is None or self.process.poll() is not None:
+            self.process = subprocess.Popen(
+                [sys.executable, "-m", self.module],
+                stdin=subprocess.PIPE,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.STDOUT,
+                text=True,
+                bufsize=65536,
+                start_new_session=True,
+                close_fds=True,
+            )
+            logger.info(f"Started {self.task_name} server process")
+        return self.process
+
+    def submit(self, job):
+        """Queue one job (a JSON-serialisable dict) on the server's stdin."""
+        process = self.ensure_started()
+        process.stdin.write(json.dumps(job) + "\n")
+        process.stdin.flush()
+
+    def terminate(self):
+        """Terminate the server process if it's still running."""
+        if self.process and self.process.poll() is None:
+            try:
+                self.process.terminate()
+                self.process.wait(timeout=5)
+            except subprocess.TimeoutExpired:
+                self.process.kill()
+            except Exception as e:
+                logger.error(f"Error terminating server process: {e}")
+
+
+class MegadetectorServer(PersistentServer):
+    """Persistent server running app.megadetector_server."""
+
+    def __init__(self):
+        super().__init__("app.megadetector_server", "MegaDetector")
+
+
+class SpeciesnetServer(PersistentServer):
+    """Persistent server running app.speciesnet_server."""
+
+    def __init__(self):
+        super().__init__("app.speciesnet_server", "SpeciesNet")
+
+
+class ServerJobWorker(_PooledWorker):
+    """Pooled worker that follows one job on a persistent server.
+
+    Reads the server's stdout until the job's status line arrives, emitting
+    the same signals as SpeciesnetWorker so widget wiring is unchanged.
+    """
+
+    def __init__(self, server, folder, task_name="MegaDetector"):
+        super().__init__(task_name)
+        self.server = server
+        self.folder = folder
+
+    def run(self):
+        try:
+            self.output_signal.emit(
+                f"Starting {self.task_name} on folder: {self.folder}"
+            )
+            logger.info(f"Starting {self.task_name} on folder: {self.folder}")
+
+            return_code = 1
+            process = self.server.process
+            # Same line coalescing as SpeciesnetWorker: one queued signal
+            # per 32 lines / 50 ms instead of one per output line
+            pending = []
+            last_flush = time.monotonic()
+            while True:
+                output = process.stdout.readline()
+                if output == "" and process.poll() is not None:
+                    break
+                output = output.strip()
+                if output.startswith(JOB_DONE_PREFIX):
+                    return_code = int(output.split()[-1])
+                    break
+                if output:
+                    pending.append(output)
+                    logger.info(output)
+                now = time.monotonic()
+                if pending and (len(pending) >= 32 or now - last_flush > 0.05):
+                    self.output_signal.emit("\n".join(pending))
+                    pending.clear()
+                    last_flush = now
+
+            if pending:
+                self.output_signal.emit("\n".join(pending))
+
+            if return_code == 0:
+                self.output_signal.emit(f"{self.task_name} completed successfully")
+                logger.info(f"{self.task_name} completed successfully")
+            else:
+                error_msg = f"{self.task_name} exited with code {return_code}"
+                self.error_signal.emit(error_msg)
+                logger.error(error_msg)
+
+        except Exception as e:
+            error_msg = f"Failed to run {self.task_name}: {str(e)}"
+            self.error_signal.emit(error_msg)
+            logger.error(error_msg)
+        finally:
+            # Ensure signals are emitted before the pool thread moves on
+            self.finished_signal.emit()
+            logger.info(f"{self.task_name} finished_signal emitted")
+            self._done.set()
+
+    def terminate_process(self):
+        """Terminate the underlying server process (a fresh one is started next run)."""
+        self.server.terminate()
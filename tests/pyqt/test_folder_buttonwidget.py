@@ -1,30 +1,19 @@
 """Unit tests for folder_buttonwidget module."""
 
-import pytest
-from PyQt6.QtWidgets import QApplication
 from app.folder_buttonwidget import FolderTab, FolderWidget
 
 
-@pytest.fixture(scope="module")
-def qapp():
-    """Create QApplication instance for tests."""
-    app = QApplication.instance()
-    if app is None:
-        app = QApplication([])
-    return app
-
-
 class TestFolderWidget:
     """Tests for FolderWidget class."""
 
-    def test_init(self, qapp):
+    def test_init(self):
         """Test FolderWidget initialization."""
         widget = FolderWidget("Test Folder")
 
         assert widget.folder_name == "Test Folder"
         assert widget.folder_path == ""
 
-    def test_set_folder_path(self, qapp):
+    def test_set_folder_path(self):
         """Test setting folder path."""
         widget = FolderWidget("Test Folder")
         test_path = "/home/user/test"
@@ -33,7 +22,7 @@ class TestFolderWidget:
 
         assert widget.get_folder_path() == test_path
 
-    def test_get_folder_path_empty(self, qapp):
+    def test_get_folder_path_empty(self):
         """Test getting folder path when not set."""
         widget = FolderWidget("Test Folder")
 
@@ -43,7 +32,7 @@ class TestFolderWidget:
 class TestFolderTab:
     """Tests for FolderTab class."""
 
-    def test_init(self, qapp):
+    def test_init(self):
         """Test FolderTab initialization."""
         tab_widget = FolderTab()
 
@@ -55,13 +44,13 @@ class TestFolderTab:
         assert "[2] Select Folder" in tab_widget.tabText(1)
         assert "[3] Select Folder" in tab_widget.tabText(2)
 
-    def test_tabs_movable(self, qapp):
+    def test_tabs_movable(self):
         """Test that tabs are movable."""
         tab_widget = FolderTab()
 
         assert tab_widget.isMovable()
 
-    def test_widget_access(self, qapp):
+    def test_widget_access(self):
         """Test accessing widgets in tabs."""
         tab_widget = FolderTab()
 
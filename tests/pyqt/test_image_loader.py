@@ -3,20 +3,10 @@
 import os
 import tempfile
 import shutil
-import pytest
-from PyQt6.QtWidgets import QApplication, QListWidget
+from PyQt6.QtWidgets import QListWidget
 from app.image_loader import load_folder_images
 
 
-@pytest.fixture(scope="module")
-def qapp():
-    """Create QApplication instance for tests."""
-    app = QApplication.instance()
-    if app is None:
-        app = QApplication([])
-    return app
-
-
 class TestImageLoader:
     """Tests for image loading functionality."""
 
@@ -51,7 +41,7 @@ class TestImageLoader:
         if os.path.exists(self.test_dir):
             shutil.rmtree(self.test_dir)
 
-    def test_load_folder_images(self, qapp):
+    def test_load_folder_images(self):
         """Test loading images from a folder."""
         file_list = QListWidget()
 
@@ -72,7 +62,7 @@ class TestImageLoader:
                 ".bmp",
             ]
 
-    def test_load_folder_images_sorted(self, qapp):
+    def test_load_folder_images_sorted(self):
         """Test that images are loaded in sorted order."""
         file_list = QListWidget()
 
@@ -85,7 +75,7 @@ class TestImageLoader:
         actual = [os.path.basename(img) for img in images]
         assert actual == expected
 
-    def test_load_folder_images_clears_list(self, qapp):
+    def test_load_folder_images_clears_list(self):
         """Test that loading images clears the previous list."""
         file_list = QListWidget()
 
@@ -100,7 +90,7 @@ class TestImageLoader:
         # Should have replaced items, not appended
         assert file_list.count() == 4
 
-    def test_load_folder_images_empty_folder(self, qapp):
+    def test_load_folder_images_empty_folder(self):
         """Test loading images from an empty folder."""
         empty_dir = os.path.join(self.test_dir, "empty")
         os.makedirs(empty_dir)
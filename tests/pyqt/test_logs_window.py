@@ -1,24 +1,14 @@
 """Unit tests for logs_window module."""
 
 import logging
-import pytest
 from PyQt6.QtWidgets import QApplication, QTextEdit
 from app.logs_window import LogHandler
 
 
-@pytest.fixture(scope="module")
-def qapp():
-    """Create QApplication instance for tests."""
-    app = QApplication.instance()
-    if app is None:
-        app = QApplication([])
-    return app
-
-
 class TestLogHandler:
     """Tests for LogHandler class."""
 
-    def test_init(self, qapp):
+    def test_init(self):
         """Test LogHandler initialization."""
         text_edit = QTextEdit()
         handler = LogHandler(text_edit)
@@ -26,7 +16,7 @@ class TestLogHandler:
         assert handler.text_edit == text_edit
         assert hasattr(handler, "log_message")
 
-    def test_emit_appends_to_text_edit(self, qapp):
+    def test_emit_appends_to_text_edit(self):
         """Test that emitting a log record appends to text edit."""
         text_edit = QTextEdit()
         handler = LogHandler(text_edit)
@@ -53,7 +43,7 @@ class TestLogHandler:
         assert "Test message" in content
         assert "INFO" in content
 
-    def test_multiple_messages(self, qapp):
+    def test_multiple_messages(self):
         """Test logging multiple messages."""
         text_edit = QTextEdit()
         handler = LogHandler(text_edit)
@@ -79,7 +69,7 @@ class TestLogHandler:
         assert "Message 2" in content
         assert "Message 3" in content
 
-    def test_auto_scroll(self, qapp):
+    def test_auto_scroll(self):
         """Test that text edit auto-scrolls to bottom."""
         text_edit = QTextEdit()
         handler = LogHandler(text_edit)
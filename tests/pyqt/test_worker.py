@@ -2,24 +2,14 @@
 
 import sys
 import time
-import pytest
 from PyQt6.QtWidgets import QApplication
 from app.worker import SpeciesnetWorker
 
 
-@pytest.fixture(scope="module")
-def qapp():
-    """Create QApplication instance for tests."""
-    app = QApplication.instance()
-    if app is None:
-        app = QApplication([])
-    return app
-
-
 class TestSpeciesnetWorker:
     """Tests for SpeciesnetWorker class."""
 
-    def test_init(self, qapp):
+    def test_init(self):
         """Test SpeciesnetWorker initialization."""
         cmd = [sys.executable, "-c", "print('test')"]
         folder = "/test/folder"
@@ -31,7 +21,7 @@ class TestSpeciesnetWorker:
         assert worker.task_name == "SpeciesNet"
         assert worker.process is None
 
-    def test_init_custom_task_name(self, qapp):
+    def test_init_custom_task_name(self):
         """Test initialization with custom task name."""
         cmd = [sys.executable, "-c", "print('test')"]
         folder = "/test/folder"
@@ -40,7 +30,7 @@ class TestSpeciesnetWorker:
 
         assert worker.task_name == "CustomTask"
 
-    def test_simple_command_execution(self, qapp):
+    def test_simple_command_execution(self):
         """Test running a simple command."""
         cmd = [sys.executable, "-c", "print('Hello World')"]
         folder = "/test/folder"
@@ -70,7 +60,7 @@ class TestSpeciesnetWorker:
             f"Expected 'Hello World' in output messages: {output_messages}"
         )
 
-    def test_command_with_error(self, qapp):
+    def test_command_with_error(self):
         """Test running a command that fails."""
         # Command that exits with error code
         cmd = [sys.executable, "-c", "import sys; sys.exit(1)"]
@@ -94,7 +84,7 @@ class TestSpeciesnetWorker:
         assert len(error_messages) > 0
         assert any("exited with code" in msg for msg in error_messages)
 
-    def test_terminate_process(self, qapp):
+    def test_terminate_process(self):
         """Test terminating a running process."""
         # Command that runs for a while
         cmd = [sys.executable, "-c", "import time; time.sleep(10); print('done')"]
@@ -117,7 +107,7 @@ class TestSpeciesnetWorker:
         if worker.process:
             assert worker.process.poll() is not None, "Process should have terminated"
 
-    def test_multiple_output_lines(self, qapp):
+    def test_multiple_output_lines(self):
         """Test capturing multiple output lines."""
         cmd = [
             sys.executable,
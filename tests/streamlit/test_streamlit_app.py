@@ -129,10 +129,32 @@ class FakeStreamlit(types.ModuleType):
         self._record("spinner", args, kwargs)
         return DummyContext(self)
 
-    def rerun(self):
-        self._record("rerun")
+    def rerun(self, scope="app"):
+        self._record("rerun", scope)
         self._rerun_called = True
 
+    def fragment(self, func=None, **kwargs):
+        # Pass-through decorator: tests execute the fragment body inline
+        if func is not None:
+            return func
+
+        def decorator(inner):
+            return inner
+
+        return decorator
+
+    def cache_data(self, *args, **kwargs):
+        # Pass-through decorator: tests run the underlying function directly
+        if args and callable(args[0]):
+            return args[0]
+
+        def decorator(func):
+            return func
+
+        return decorator
+
+    cache_resource = cache_data
+
 
 def _load_app(monkeypatch, fake_st, overrides=None):
     monkeypatch.setitem(sys.modules, "streamlit", fake_st)
@@ -182,7 +204,7 @@ def test_initial_state_shows_no_images_message(monkeypatch):
     _load_app(monkeypatch, fake_st)
 
     assert fake_st.session_state.current_folder is None
-    assert fake_st.session_state.image_files == []
+    assert fake_st.session_state.image_files == ()
     assert _has_call_with_text(fake_st._calls, "info", "Please load a folder")
 
 
@@ -280,4 +302,7 @@ def test_copy_button_invokes_copy(monkeypatch, tmp_path):
         overrides={"copy_image_to_folder": _copy_image_to_folder},
     )
 
+    # Copies are queued on a background pool; wait for them to complete
+    fake_st.session_state._copy_pool.shutdown(wait=True)
+
     assert calls == [(str(image_path), str(destination))]